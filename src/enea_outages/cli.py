@@ -1,7 +1,8 @@
 import argparse
+import logging
 
 from .client import EneaOutagesClient
-from .models import OutageType
+from .models import Outage, OutageType
 
 
 def run_cli_logic():
@@ -23,12 +24,28 @@ def run_cli_logic():
         default="Poznań",
         help="Specify the region to check for outages. Default is 'Poznań'.",
     )
+    parser.add_argument(
+        "--all-regions",
+        action="store_true",
+        help="Check every available region (fetched concurrently) instead of a single --region.",
+    )
     parser.add_argument(
         "--address",
-        help="Specify a street address to filter outages. Requires --region.",
+        help="Specify a street address to filter outages. Applies to --region or --all-regions.",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Show debug logging (HTTP details, unparseable outage blocks).",
     )
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+    if args.verbose:
+        # Only this package's messages; the root stays at WARNING so httpcore/h2 traces stay quiet.
+        logging.getLogger("enea_outages").setLevel(logging.DEBUG)
+
     outage_type = OutageType[args.type.upper()]
 
     with EneaOutagesClient() as client:
@@ -46,21 +63,34 @@ def run_cli_logic():
                 print(f"An error occurred: {e}")
             return
 
-        print(f"Fetching {args.type} outages for region: {args.region}...")
         try:
-            if args.address:
+            # (branch, outage) pairs; the branch is only shown when several branches were queried.
+            outages: list[tuple[str | None, Outage]]
+            if args.all_regions:
+                print(f"Fetching {args.type} outages for all regions...")
+                results = client.get_outages_for_all_regions(outage_type)
+                outages = [(branch, outage) for branch, region_outages in results.items() for outage in region_outages]
+                if args.address:
+                    print(f"Filtering for address: {args.address}")
+                    needle = args.address.lower()
+                    outages = [(branch, outage) for branch, outage in outages if needle in outage.description_lower]
+            elif args.address:
+                print(f"Fetching {args.type} outages for region: {args.region}...")
                 print(f"Filtering for address: {args.address}")
-                outages = client.get_outages_for_address(args.address, args.region, outage_type)
+                outages = [(None, o) for o in client.get_outages_for_address(args.address, args.region, outage_type)]
             else:
-                outages = client.get_outages_for_region(args.region, outage_type)
+                print(f"Fetching {args.type} outages for region: {args.region}...")
+                outages = [(None, o) for o in client.get_outages_for_region(args.region, outage_type)]
 
             if not outages:
                 print("No outages found for the specified criteria.")
                 return
 
             print(f"\nFound {len(outages)} outage notice(s):")
-            for outage in outages:
+            for branch, outage in outages:
                 print("-" * 40)
+                if branch is not None:
+                    print(f"  Oddział: {branch}")
                 print(f"  Obszar: {outage.region}")
                 print(f"  Opis: {outage.description}")
                 if outage.start_time:
@@ -1,46 +1,405 @@
 from __future__ import annotations
 
+import functools
+import importlib.util
 import logging
 import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from types import TracebackType
-from typing import Tuple
+from html import unescape
+from itertools import islice
+from types import MappingProxyType, TracebackType
+from typing import Any, Generic, TypeVar
 
 import httpx
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from .models import Outage, OutageType
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional (the "fast" extra); BeautifulSoup is the fallback
+    LexborHTMLParser = None  # type: ignore[assignment,misc]
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional (the "fast" extra); a plain substring loop is the fallback
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+_SELECTOLAX_AVAILABLE = LexborHTMLParser is not None
+# httpx only supports HTTP/2 when the optional h2 package is installed (the "fast" extra pulls it in).
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+# BeautifulSoup is only used without selectolax; prefer the C-based lxml parser, but degrade to the
+# pure-Python html.parser on platforms where lxml could not be installed.
+_BS4_PARSER = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
+# Limits BeautifulSoup to the outage block subtrees when nothing else on the page is needed. The class is
+# matched as a token because the strainer sees the raw attribute string; the CSS selector does the rest.
+_OUTAGE_STRAINER = SoupStrainer("div", attrs={"class": re.compile(r"(?:^|\s)unpl(?:\s|$)")})
+
+# Polish genitive month names, as they appear on the site (already lowercase). Kept as a plain dict because
+# it is looked up for every parsed date; MappingProxyType would add a level of indirection to each lookup.
+_MONTH_MAP: dict[str, int] = {
+    name: number
+    for number, name in enumerate(
+        (
+            "stycznia",
+            "lutego",
+            "marca",
+            "kwietnia",
+            "maja",
+            "czerwca",
+            "lipca",
+            "sierpnia",
+            "września",
+            "października",
+            "listopada",
+            "grudnia",
+        ),
+        start=1,
+    )
+}
+
+# The two date formats share their leading "<day> <month> <year> r." part:
+#   planned:   "8 grudnia 2025 r. w godz. 08:00 - 16:00"
+#   unplanned: "19 listopada 2025 r. do godziny 12:30"
+_DATE_PREFIX = r"(\d{1,2})\s+(\w+)\s+(\d{4})\s+r\.\s+"
+_PLANNED_TAIL = r"w\s+godz\.\s+(\d{1,2}):(\d{2})\s+-\s+(\d{1,2}):(\d{2})"
+_UNPLANNED_TAIL = r"do\s+godziny\s+(\d{1,2}):(\d{2})"
+_PLANNED_DATE_RE = re.compile(_DATE_PREFIX + _PLANNED_TAIL)
+_UNPLANNED_DATE_RE = re.compile(_DATE_PREFIX + _UNPLANNED_TAIL)
+# Both formats in one pattern, for when the page type is not known: a single scan decides which one it is.
+_DATE_RE = re.compile(_DATE_PREFIX + f"(?:{_PLANNED_TAIL}|{_UNPLANNED_TAIL})")
+
+# The region <select> is small, server-rendered and stable, so its options can be read straight from the
+# raw HTML without building a DOM.
+_REGION_SELECT_RE = re.compile(r'<select[^>]*\sid="oddzial"[^>]*>(.*?)</select>', re.DOTALL | re.IGNORECASE)
+_OPTION_VALUE_RE = re.compile(r'<option[^>]*\svalue="([^"]+)"', re.IGNORECASE)
+
+
+def _parse_regions_fast(html: str) -> list[str]:
+    """Extracts the region names from the `<select id="oddzial">` options with regexes."""
+    match = _REGION_SELECT_RE.search(html)
+    if match is None:
+        return []
+    return [unescape(value) for value in _OPTION_VALUE_RE.findall(match.group(1))]
+
+
+def _month_number(month_name: str) -> int:
+    """Resolves a Polish month name to its number, lowercasing only if the exact form is unknown."""
+    try:
+        return _MONTH_MAP[month_name]
+    except KeyError:
+        pass
+    try:
+        return _MONTH_MAP[month_name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown month name: {month_name}") from None
+
+
+def _hour_minute(token: str) -> tuple[int, int] | None:
+    """Splits an "H:MM" / "HH:MM" token into integers, or returns None if it has any other shape."""
+    hour, sep, minute = token.partition(":")
+    if sep and len(hour) in (1, 2) and len(minute) == 2 and hour.isdecimal() and minute.isdecimal():
+        return int(hour), int(minute)
+    return None
+
+
+def _parse_date_formats_fast(date_info: str) -> tuple[datetime | None, datetime | None] | None:
+    """
+    Parses the two known date layouts by splitting on whitespace, without the regex engine.
+
+    Returns None when the text does not have exactly the expected shape, so the caller can fall back to
+    the regexes (which also produce the proper error messages). The digit checks mirror the regexes, so
+    this never accepts text they would reject (int() alone would also take signs and underscores).
+    """
+    tokens = date_info.split()
+    if len(tokens) not in (7, 9) or tokens[3] != "r.":
+        return None
+    day_token, month_name, year_token = tokens[0], tokens[1], tokens[2]
+    if not (len(day_token) in (1, 2) and day_token.isdecimal()):
+        return None
+    if not (len(year_token) == 4 and year_token.isdecimal()):
+        return None
+    month = _MONTH_MAP.get(month_name)
+    if month is None:
+        return None
+    day, year = int(day_token), int(year_token)
+    try:
+        # Planned: "8 grudnia 2025 r. w godz. 08:00 - 16:00"
+        if len(tokens) == 9 and tokens[4] == "w" and tokens[5] == "godz." and tokens[7] == "-":
+            start, end = _hour_minute(tokens[6]), _hour_minute(tokens[8])
+            if start is None or end is None:
+                return None
+            return datetime(year, month, day, *start), datetime(year, month, day, *end)
+        # Unplanned: "19 listopada 2025 r. do godziny 12:30"
+        if len(tokens) == 7 and tokens[4] == "do" and tokens[5] == "godziny":
+            until = _hour_minute(tokens[6])
+            if until is None:
+                return None
+            return None, datetime(year, month, day, *until)
+    except ValueError:
+        # Out-of-range values (e.g. 31 lutego); the regex path raises the error for these.
+        pass
+    return None
+
+
+def _planned_times(
+    day: str, month_name: str, year: str, start_hour: str, start_min: str, end_hour: str, end_min: str
+) -> tuple[datetime | None, datetime | None]:
+    y, m, d = int(year), _month_number(month_name), int(day)
+    return datetime(y, m, d, int(start_hour), int(start_min)), datetime(y, m, d, int(end_hour), int(end_min))
+
+
+def _unplanned_times(
+    day: str, month_name: str, year: str, hour: str, minute: str
+) -> tuple[datetime | None, datetime | None]:
+    # For unplanned, we only have an end time. Start time is unknown.
+    return None, datetime(int(year), _month_number(month_name), int(day), int(hour), int(minute))
+
+
+# "godziny" does not contain "godz.", so each literal marker belongs to exactly one format.
+def _search_planned(date_info: str) -> tuple[datetime | None, datetime | None] | None:
+    """Parses the planned date format, or returns None if the text is not in it."""
+    if "godz." in date_info and (match := _PLANNED_DATE_RE.search(date_info)):
+        return _planned_times(*match.groups())
+    return None
+
+
+def _search_unplanned(date_info: str) -> tuple[datetime | None, datetime | None] | None:
+    """Parses the unplanned date format, or returns None if the text is not in it."""
+    if "godziny" in date_info and (match := _UNPLANNED_DATE_RE.search(date_info)):
+        return _unplanned_times(*match.groups())
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_date_formats(
+    date_info: str, outage_type: OutageType | None = None
+) -> tuple[datetime | None, datetime | None]:
+    """
+    Parses different date formats and returns a tuple of (start_time, end_time).
+
+    A regex is only run for a format whose literal marker ("godz." or "godziny") is in the text, so text
+    with neither is rejected without touching the regex engine. With an outage type, the regex for that
+    page's format runs first and the other format is only a fallback; without one, the combined regex
+    decides the format in one scan. Outages on one page often share the same date text, so results are
+    memoized; this is safe because datetime objects are immutable.
+    """
+    parsed = _parse_date_formats_fast(date_info)
+    if parsed is not None:
+        return parsed
+
+    if outage_type is None:
+        if ("godz." in date_info or "godziny" in date_info) and (match := _DATE_RE.search(date_info)):
+            # One groups() call and a tuple unpack is cheaper than a group() call per field.
+            groups = match.groups()
+            if groups[3] is not None:
+                return _planned_times(*groups[:7])
+            return _unplanned_times(*groups[:3], *groups[7:])
+        raise ValueError(f"Could not parse date information: {date_info}")
+
+    # The page type's own format is tried first; the other one is only a fallback for an odd block.
+    if outage_type is OutageType.PLANNED:
+        parsed = _search_planned(date_info) or _search_unplanned(date_info)
+    else:
+        parsed = _search_unplanned(date_info) or _search_planned(date_info)
+    if parsed is not None:
+        return parsed
+    raise ValueError(f"Could not parse date information: {date_info}")
+
+
+def _is_transient(error: httpx.HTTPError) -> bool:
+    """Tells whether an HTTP error may go away on a retry: a transport failure or a 5xx response."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.is_server_error
+    return isinstance(error, httpx.TransportError)
+
+
+def _parse_html(html: str, outages_only: bool = False) -> Any:
+    """
+    Parses an HTML document into a selectolax tree, or a BeautifulSoup tree if selectolax is unavailable.
+
+    With outages_only, the BeautifulSoup tree contains just the outage blocks (selectolax always parses the
+    whole document, which is already cheap).
+    """
+    if _SELECTOLAX_AVAILABLE:
+        return LexborHTMLParser(html)
+    return BeautifulSoup(html, _BS4_PARSER, parse_only=_OUTAGE_STRAINER if outages_only else None)
+
+
+def _select(node: Any, selector: str) -> list[Any]:
+    """Returns all descendants of a parsed tree or node matching a CSS selector."""
+    if isinstance(node, Tag):
+        return node.select(selector)
+    return node.css(selector)
+
+
+def _select_first(node: Any, selector: str) -> Any:
+    """Returns the first descendant of a selectolax or BeautifulSoup node matching a CSS selector."""
+    if isinstance(node, Tag):
+        return node.select_one(selector)
+    return node.css_first(selector)
+
+
+def _iter_elements(node: Any) -> Iterator[tuple[str, list[str], Any]]:
+    """Yields (tag, classes, element) for every element below a selectolax or BeautifulSoup node."""
+    if isinstance(node, Tag):
+        for element in node.find_all(True):
+            yield element.name, element.get("class") or [], element
+        return
+    # selectolax's traverse() starts with the node itself.
+    for element in islice(node.traverse(), 1, None):
+        yield element.tag, (element.attributes.get("class") or "").split(), element
+
+
+def _node_text(node: Any) -> str:
+    """Returns the stripped text content of a selectolax or BeautifulSoup node."""
+    if isinstance(node, Tag):
+        return node.get_text(strip=True)
+    return node.text(strip=True)
+
+
+def _node_html(node: Any) -> str:
+    """Returns the outer HTML of a selectolax or BeautifulSoup node."""
+    if isinstance(node, Tag):
+        return str(node)
+    return node.html or ""
+
+
+def _node_attr(node: Any, name: str) -> str | None:
+    """Returns an attribute value of a selectolax or BeautifulSoup node."""
+    if isinstance(node, Tag):
+        value = node.get(name)
+        return value if isinstance(value, str) else None
+    return node.attributes.get(name)
+
+
+_V = TypeVar("_V")
+
+
+class _TTLCache(Generic[_V]):
+    """A small thread-safe LRU cache whose entries expire a fixed number of seconds after being stored."""
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, _V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+
+    def get(self, key: Hashable) -> _V | None:
+        """Returns the cached value for a key, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: _V) -> None:
+        """Stores a value, evicting the least recently used entries beyond maxsize."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], _V]) -> _V:
+        """
+        Returns the cached value for a key, computing and storing it with factory() on a miss.
+
+        Concurrent misses for the same key are coalesced: one caller runs factory() while the others
+        wait for its result instead of issuing duplicate requests.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                value = self.get(key)
+                if value is None:
+                    value = factory()
+                    self.set(key, value)
+                return value
+        finally:
+            # Keys can be arbitrary caller input (e.g. region names), so per-key locks must not pile up.
+            # Waiters that already hold a reference to this lock still find the stored value.
+            with self._lock:
+                if self._key_locks.get(key) is key_lock:
+                    del self._key_locks[key]
+
+    def clear(self) -> None:
+        """Drops all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
 
 class EneaOutagesClient:
     """Synchronous client for Enea Operator power outages."""
 
     BASE_URL = "https://wylaczenia.operator.enea.pl/index.php"
     DEFAULT_TIMEOUT = 10.0
-    MONTH_MAP = {
-        "stycznia": 1,
-        "lutego": 2,
-        "marca": 3,
-        "kwietnia": 4,
-        "maja": 5,
-        "czerwca": 6,
-        "lipca": 7,
-        "sierpnia": 8,
-        "września": 9,
-        "października": 10,
-        "listopada": 11,
-        "grudnia": 12,
-    }
-
-    def __init__(self, timeout: float = DEFAULT_TIMEOUT) -> None:
-        self._client = httpx.Client(timeout=timeout)
+    # Keep idle connections around long enough to be reused across consecutive calls (e.g. regions + outages).
+    DEFAULT_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0)
+    DEFAULT_CONCURRENCY = 8
+    DEFAULT_RETRIES = 2
+    RETRY_BACKOFF = 0.5
+    DEFAULT_CACHE_SIZE = 32
+    DEFAULT_REGIONS_CACHE_TTL = 86400.0
+    # Read-only view of the module's month table, kept for backwards compatibility. Date parsing is stateless
+    # and memoized at module level, so it reads _MONTH_MAP directly and overriding this has no effect.
+    MONTH_MAP: Mapping[str, int] = MappingProxyType(_MONTH_MAP)
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        cache_ttl: float = 0.0,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        fast_regions: bool = True,
+        regions_cache_ttl: float = DEFAULT_REGIONS_CACHE_TTL,
+    ) -> None:
+        """
+        Args:
+            timeout: The HTTP timeout in seconds.
+            cache_ttl: How long, in seconds, parsed outages for a (region, outage_type) pair are reused
+                before the page is fetched again. 0 (the default) disables caching.
+            cache_size: The maximum number of (region, outage_type) pairs kept in the cache.
+            fast_regions: Read the region list with a regex over the raw HTML instead of parsing the page.
+                Set to False if the site's markup changes in a way the regex no longer matches.
+            regions_cache_ttl: How long, in seconds, the list of regions is reused before it is fetched again
+                (a day by default; the list practically never changes).
+        """
+        self._fast_regions = fast_regions
+        # httpx advertises (and transparently decodes) gzip, plus brotli when a brotli package is installed.
+        self._client = httpx.Client(timeout=timeout, limits=self.DEFAULT_LIMITS, http2=_HTTP2_AVAILABLE)
+        self._cache: _TTLCache[list[Outage]] | None = _TTLCache(cache_ttl, cache_size) if cache_ttl > 0 else None
+        # The list of regions practically never changes, so it is memoized for a long time.
+        self._regions_cache_ttl = regions_cache_ttl
+        self._regions_cache: list[str] | None = None
+        self._regions_cache_expires_at = 0.0
+        self._regions_lock = threading.Lock()
 
     def close(self) -> None:
         """Closes the underlying HTTP connection pool."""
         self._client.close()
 
+    def clear_cache(self) -> None:
+        """Discards all cached outages so the next calls fetch fresh data."""
+        if self._cache is not None:
+            self._cache.clear()
+
     def __enter__(self) -> EneaOutagesClient:
         return self
 
@@ -52,49 +411,41 @@ class EneaOutagesClient:
     ) -> None:
         self.close()
 
-    def _parse_date_formats(self, date_info: str) -> Tuple[datetime | None, datetime | None]:
+    def _parse_date_formats(
+        self, date_info: str, outage_type: OutageType | None = None
+    ) -> tuple[datetime | None, datetime | None]:
         """
         Parses different date formats and returns a tuple of (start_time, end_time).
-        """
-        # Planned outage format: "8 grudnia 2025 r. w godz. 08:00 - 16:00"
-        planned_match = re.search(
-            r"(\d{1,2})\s+(\w+)\s+(\d{4})\s+r\.\s+w\s+godz\.\s+(\d{1,2}):(\d{2})\s+-\s+(\d{1,2}):(\d{2})", date_info
-        )
-        if planned_match:
-            day, month_name, year, start_hour, start_min, end_hour, end_min = planned_match.groups()
-            month = self.MONTH_MAP.get(month_name.lower())
-            if not month:
-                raise ValueError(f"Unknown month name: {month_name}")
-
-            start_time = datetime(int(year), month, int(day), int(start_hour), int(start_min))
-            end_time = datetime(int(year), month, int(day), int(end_hour), int(end_min))
-            return start_time, end_time
-
-        # Unplanned outage format: "19 listopada 2025 r. do godziny 12:30"
-        unplanned_match = re.search(r"(\d{1,2})\s+(\w+)\s+(\d{4})\s+r\.\s+do\s+godziny\s+(\d{1,2}):(\d{2})", date_info)
-        if unplanned_match:
-            day, month_name, year, hour, minute = unplanned_match.groups()
-            month = self.MONTH_MAP.get(month_name.lower())
-            if not month:
-                raise ValueError(f"Unknown month name: {month_name}")
-
-            # For unplanned, we only have an end time. Start time is unknown.
-            end_time = datetime(int(year), month, int(day), int(hour), int(minute))
-            return None, end_time
 
-        raise ValueError(f"Could not parse date information: {date_info}")
-
-    def _parse_outage_block(self, block: BeautifulSoup) -> Outage:
-        """Parses a single outage HTML block into an Outage object."""
-        region_tag = block.find("h4", {"class": "title_"})
-        description_tag = block.find("p", {"class": "description"})
-        date_info_tag = block.find("p", {"class": "bold subtext"})
+        Thin wrapper over the memoized module-level parser, which does not depend on client state.
+        """
+        return _parse_date_formats(date_info, outage_type)
 
-        region = region_tag.get_text(strip=True) if region_tag else "Nieznany obszar"
-        description = description_tag.get_text(strip=True) if description_tag else "Brak opisu"
-        date_info_str = date_info_tag.get_text(strip=True) if date_info_tag else ""
+    def _parse_outage_block(self, block: Any, outage_type: OutageType | None = None) -> Outage:
+        """
+        Parses a single outage HTML block (selectolax or BeautifulSoup node) into an Outage object.
 
-        start_time, end_time = self._parse_date_formats(date_info_str)
+        The outage type of the page, if known, tells the date parser which format to expect.
+        """
+        # Collect the three fields in a single walk over the block instead of one search per field.
+        region_tag = description_tag = date_info_tag = None
+        for tag, classes, element in _iter_elements(block):
+            if tag == "h4":
+                if region_tag is None and "title_" in classes:
+                    region_tag = element
+            elif tag == "p":
+                if description_tag is None and "description" in classes:
+                    description_tag = element
+                elif date_info_tag is None and "bold" in classes and "subtext" in classes:
+                    date_info_tag = element
+
+        region = _node_text(region_tag) if region_tag is not None else "Nieznany obszar"
+        description = _node_text(description_tag) if description_tag is not None else "Brak opisu"
+        date_info_str = _node_text(date_info_tag) if date_info_tag is not None else ""
+        if not date_info_str:
+            raise ValueError("Missing date information")
+
+        start_time, end_time = self._parse_date_formats(date_info_str, outage_type)
 
         return Outage(region=region, description=description, start_time=start_time, end_time=end_time)
 
@@ -102,6 +453,13 @@ class EneaOutagesClient:
         """Fetches the raw HTML content for a given region and outage type."""
         params = {"page": outage_type.value, "oddzial": region}
         response = self._client.get(self.BASE_URL, params=params)
+        logger.debug(
+            "Fetched %s via %s (%s, %s bytes on the wire)",
+            response.url,
+            response.http_version,
+            response.headers.get("content-encoding", "identity"),
+            response.headers.get("content-length", "?"),
+        )
         response.raise_for_status()
         return response.text
 
@@ -118,17 +476,174 @@ class EneaOutagesClient:
         Returns:
             A list of Outage objects.
         """
-        html = self._fetch_raw_html(region, outage_type)
-        soup = BeautifulSoup(html, "html.parser")
-        outage_blocks = soup.find_all("div", {"class": "unpl block info"})
+        if self._cache is None:
+            return self._fetch_outages(region, outage_type)
+        return list(self._cache.get_or_set((region, outage_type), lambda: self._fetch_outages(region, outage_type)))
+
+    def _fetch_outages(self, region: str, outage_type: OutageType) -> list[Outage]:
+        """Fetches and parses all outage blocks for a region, bypassing the cache."""
+        return self._fetch_and_parse(region, outage_type)[0]
+
+    def _fetch_and_parse(
+        self, region: str, outage_type: OutageType, predicate: Callable[[str], bool] | None = None
+    ) -> tuple[list[Outage], list[str]]:
+        """
+        Fetches a page once and extracts both its outages and the region list from it.
 
-        outages: list[Outage] = []
-        for block in outage_blocks:
+        Every page carries the region selector, so the regions found here also seed the memoized list used
+        by get_available_regions(). The optional predicate filters outage blocks as in _iter_outages().
+        """
+        outages, regions = self._parse_page(self._fetch_raw_html(region, outage_type), outage_type, predicate)
+        if regions:
+            with self._regions_lock:
+                self._store_regions(regions)
+        return outages, regions
+
+    def _store_regions(self, regions: list[str]) -> None:
+        """Memoizes the list of regions; the caller must hold _regions_lock."""
+        self._regions_cache = regions
+        self._regions_cache_expires_at = time.monotonic() + self._regions_cache_ttl
+
+    def _parse_page(
+        self,
+        html: str,
+        outage_type: OutageType | None = None,
+        predicate: Callable[[str], bool] | None = None,
+    ) -> tuple[list[Outage], list[str]]:
+        """Extracts both the outages and the region list from a page, parsing it at most once."""
+        if self._fast_regions:
+            # Regions come straight from the raw HTML, so the tree only needs the outage blocks.
+            return self._parse_outages(html, outage_type, predicate), _parse_regions_fast(html)
+        tree = _parse_html(html)
+        return list(self._iter_outages(tree, predicate, outage_type)), self._regions_from_tree(tree)
+
+    def _parse_outages(
+        self, html: str, outage_type: OutageType | None = None, predicate: Callable[[str], bool] | None = None
+    ) -> list[Outage]:
+        """Parses the outage blocks on an outages page (those accepted by the predicate, if one is given)."""
+        return list(self._iter_outages(_parse_html(html, outages_only=True), predicate, outage_type))
+
+    @classmethod
+    def _parse_regions(cls, html: str) -> list[str]:
+        """Parses the region names out of the `<select id="oddzial">` options on a page."""
+        return cls._regions_from_tree(_parse_html(html))
+
+    @staticmethod
+    def _regions_from_tree(tree: Any) -> list[str]:
+        """Extracts the region names from an already parsed page."""
+        options = _select(tree, "select#oddzial option[value]")
+        return [value for option in options if (value := _node_attr(option, "value"))]
+
+    def _iter_outages(
+        self,
+        tree: Any,
+        predicate: Callable[[str], bool] | None = None,
+        outage_type: OutageType | None = None,
+    ) -> Iterator[Outage]:
+        """
+        Yields an Outage for each outage block on a page, skipping (and logging) unparseable blocks.
+
+        If a predicate is given, it is called with each block's description first, and blocks it rejects
+        are skipped before their dates are parsed or an Outage is built. The outage type of the page, if
+        known, is passed on to the block parser.
+        """
+        for block in _select(tree, "div.unpl.block.info"):
+            if predicate is not None:
+                description_tag = _select_first(block, "p.description")
+                if description_tag is None or not predicate(_node_text(description_tag)):
+                    continue
             try:
-                outages.append(self._parse_outage_block(block))
+                yield self._parse_outage_block(block, outage_type)
             except (ValueError, AttributeError) as e:
                 logger.warning("Error parsing outage block: %s", e)
-        return outages
+                # Serializing the block is comparatively expensive, so only do it when someone will see it.
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Offending block: %s", _node_html(block))
+
+    def _get_outages_with_retry(self, region: str, outage_type: OutageType, retries: int) -> list[Outage]:
+        """
+        Calls get_outages_for_region, retrying transient HTTP errors with exponential backoff.
+
+        Only connection-level failures and 5xx responses are retried; a 4xx (e.g. an unknown region) will
+        not change on a second attempt, so it is raised immediately.
+        """
+        attempt = 0
+        while True:
+            try:
+                return self.get_outages_for_region(region, outage_type)
+            except httpx.HTTPError as e:
+                if attempt >= retries or not _is_transient(e):
+                    raise
+                delay = self.RETRY_BACKOFF * 2**attempt
+                logger.warning("Fetching outages for %s failed (%s), retrying in %.1fs", region, e, delay)
+                time.sleep(delay)
+                attempt += 1
+
+    def get_outages_for_regions(
+        self,
+        regions: Iterable[str],
+        outage_type: OutageType = OutageType.UNPLANNED,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        retries: int = DEFAULT_RETRIES,
+    ) -> dict[str, list[Outage]]:
+        """
+        Retrieves power outages for several regions concurrently.
+
+        Requests are issued from a thread pool over the shared connection pool, so the total time is
+        close to that of the slowest region rather than the sum of all of them. Each page is parsed in the
+        worker that fetched it, so parsing one region overlaps with the network wait of the others.
+
+        Args:
+            regions: The names of the Enea Operator branches to query.
+            outage_type: The type of outage to fetch (PLANNED or UNPLANNED).
+            concurrency: The maximum number of requests in flight at once.
+            retries: How many times to retry a region after a transient HTTP error before giving up.
+
+        Returns:
+            A dict mapping each region name to its list of Outage objects, in the order given. A region
+            that still fails after its retries is logged and left out, so it does not discard the others.
+
+        Raises:
+            TypeError: If regions is a single str rather than an iterable of region names.
+        """
+        if isinstance(regions, str):
+            # A str is itself an iterable of str, and would be fanned out character by character.
+            raise TypeError("regions must be an iterable of region names, not a single str")
+        unique_regions = list(dict.fromkeys(regions))
+        if not unique_regions:
+            return {}
+
+        def fetch(region: str) -> list[Outage] | None:
+            try:
+                return self._get_outages_with_retry(region, outage_type, retries)
+            except httpx.HTTPError as e:
+                logger.warning("Giving up on outages for %s: %s", region, e)
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(unique_regions)))) as executor:
+            results = executor.map(fetch, unique_regions)
+            return {region: outages for region, outages in zip(unique_regions, results) if outages is not None}
+
+    def get_outages_for_all_regions(
+        self,
+        outage_type: OutageType = OutageType.UNPLANNED,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        retries: int = DEFAULT_RETRIES,
+    ) -> dict[str, list[Outage]]:
+        """
+        Retrieves power outages for every available region, fetching the regions concurrently.
+
+        Args:
+            outage_type: The type of outage to fetch (PLANNED or UNPLANNED).
+            concurrency: The maximum number of requests in flight at once.
+            retries: How many times to retry a region after a transient HTTP error before giving up.
+
+        Returns:
+            A dict mapping each region name to its list of Outage objects (see get_outages_for_regions).
+        """
+        return self.get_outages_for_regions(
+            self.get_available_regions(), outage_type, concurrency=concurrency, retries=retries
+        )
 
     def get_outages_for_address(
         self, address: str, region: str = "Poznań", outage_type: OutageType = OutageType.UNPLANNED
@@ -144,26 +659,98 @@ class EneaOutagesClient:
         Returns:
             A list of Outage objects relevant to the given address.
         """
-        all_outages = self.get_outages_for_region(region, outage_type)
-        return [o for o in all_outages if address.lower() in o.description.lower()]
+        needle = address.lower()
+        if self._cache is not None:
+            all_outages = self.get_outages_for_region(region, outage_type)
+            return [o for o in all_outages if needle in o.description_lower]
+
+        # Without a cache, filter on the raw description so non-matching blocks are never fully parsed.
+        return self._fetch_and_parse(region, outage_type, lambda description: needle in description.lower())[0]
+
+    def get_outages_for_addresses(
+        self, addresses: Iterable[str], region: str = "Poznań", outage_type: OutageType = OutageType.UNPLANNED
+    ) -> list[tuple[Outage, list[str]]]:
+        """
+        Retrieves power outages affecting any of several addresses, fetching the region page once.
+
+        Matching is case-insensitive. With pyahocorasick installed, all addresses are found in a single
+        scan of each description; otherwise each address is checked with a substring test.
+
+        Args:
+            addresses: The streets or addresses to check.
+            region: The name of the Enea Operator branch.
+            outage_type: The type of outage to fetch.
+
+        Returns:
+            A list of (Outage, matched addresses) pairs for every outage mentioning at least one of the
+            addresses. Matched addresses are given as passed in, in the order they were passed.
+
+        Raises:
+            TypeError: If addresses is a single str rather than an iterable of addresses.
+        """
+        if isinstance(addresses, str):
+            # A str is itself an iterable of str, and would be matched character by character.
+            raise TypeError("addresses must be an iterable of addresses, not a single str")
+        # (needle, address) pairs in the order given; spellings that casefold alike each keep their own pair.
+        needles = [(address.casefold(), address) for address in dict.fromkeys(addresses)]
+        if not needles:
+            return []
+
+        outages = self.get_outages_for_region(region, outage_type)
+        matches: list[tuple[Outage, list[str]]] = []
+        if ahocorasick is not None and all(needle for needle, _ in needles):
+            automaton = ahocorasick.Automaton()
+            for needle, _ in needles:
+                automaton.add_word(needle, needle)
+            automaton.make_automaton()
+            for outage in outages:
+                found = {needle for _, needle in automaton.iter(outage.description.casefold())}
+                if found:
+                    matches.append((outage, [address for needle, address in needles if needle in found]))
+        else:
+            for outage in outages:
+                description = outage.description.casefold()
+                hits = [address for needle, address in needles if needle in description]
+                if hits:
+                    matches.append((outage, hits))
+        return matches
 
     def get_available_regions(self) -> list[str]:
         """
         Retrieves the list of available regions (oddziały) from the Enea website.
 
+        The result is fetched once and then reused for regions_cache_ttl seconds; call refresh_regions() to
+        fetch it again sooner.
+
         Returns:
             A list of available region names.
         """
-        # The list of regions is the same for all page types, so we can hardcode one.
-        html = self._fetch_raw_html(region="Poznań", outage_type=OutageType.PLANNED)
-        soup = BeautifulSoup(html, "html.parser")
-
-        region_select = soup.find("select", {"id": "oddzial"})
-        if not isinstance(region_select, Tag):
-            return []
+        # Holding the lock while fetching makes concurrent first callers share a single request.
+        with self._regions_lock:
+            regions = self._regions_cache
+            if regions is None or self._regions_cache_expires_at <= time.monotonic():
+                # The list of regions is the same for all page types, so we can hardcode one.
+                key = ("Poznań", OutageType.PLANNED)
+                html = self._fetch_raw_html(*key)
+                if self._cache is None:
+                    regions = _parse_regions_fast(html) if self._fast_regions else self._parse_regions(html)
+                else:
+                    # The outages on this page come with the same fetch, so keep them for later calls.
+                    outages, regions = self._parse_page(html, key[1])
+                    self._cache.set(key, outages)
+                if not regions:
+                    # Don't memoize a page that came back without the region selector.
+                    return []
+                self._store_regions(regions)
+            return list(regions)
+
+    def refresh_regions(self) -> list[str]:
+        """
+        Discards the memoized list of regions and fetches it again.
 
-        return [
-            option["value"]
-            for option in region_select.find_all("option")
-            if option.has_attr("value") and option["value"]
-        ]
+        Returns:
+            A list of available region names.
+        """
+        with self._regions_lock:
+            self._regions_cache = None
+        return self.get_available_regions()
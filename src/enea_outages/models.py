@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from itertools import compress
 
 
 class OutageType(Enum):
@@ -12,11 +14,68 @@ class OutageType(Enum):
     UNPLANNED = "awarie"
 
 
-@dataclass
-class Outage:
-    """Represents a power outage from Enea Operator."""
+class _DerivedOutageSlots:
+    """Holds Outage's derived attributes outside its dataclass fields, so fields() and asdict() omit them."""
+
+    __slots__ = ("description_lower",)
+
+    # Lowercased description, computed once so repeated address filtering does not re-lowercase it.
+    description_lower: str
+
+
+@dataclass(slots=True, frozen=True)
+class Outage(_DerivedOutageSlots):
+    """
+    Represents a power outage from Enea Operator.
+
+    Instances are immutable and hashable, so they can be de-duplicated with a set (e.g. across regions).
+    """
 
     region: str
     description: str
     start_time: datetime | None
     end_time: datetime | None
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "description_lower", self.description.lower())
+
+    def __reduce__(self) -> tuple[type[Outage], tuple[str, str, datetime | None, datetime | None]]:
+        # Rebuild through __init__ so pickling and copying recompute the derived attributes.
+        return type(self), (self.region, self.description, self.start_time, self.end_time)
+
+
+class OutageBatch:
+    """
+    A collection of outages kept for repeated address filtering of a large result set (e.g. every region).
+
+    The lowercased descriptions are gathered into one flat list up front, alongside the Outage objects
+    themselves, so each filter is a single scan over strings that returns the original outages.
+    """
+
+    __slots__ = ("descriptions_lower", "outages")
+
+    def __init__(self) -> None:
+        self.outages: list[Outage] = []
+        self.descriptions_lower: list[str] = []
+
+    @classmethod
+    def from_outages(cls, outages: Iterable[Outage]) -> OutageBatch:
+        """Builds a batch from Outage objects."""
+        batch = cls()
+        batch.outages = list(outages)
+        batch.descriptions_lower = [outage.description_lower for outage in batch.outages]
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.outages)
+
+    def __getitem__(self, index: int) -> Outage:
+        return self.outages[index]
+
+    def __iter__(self) -> Iterator[Outage]:
+        return iter(self.outages)
+
+    def filter_by_address(self, address: str) -> list[Outage]:
+        """Returns the outages whose description contains the address (case-insensitive)."""
+        needle = address.lower()
+        return list(compress(self.outages, [needle in description for description in self.descriptions_lower]))
@@ -1,11 +1,16 @@
+import copy
+import dataclasses
+import pickle
+
 import pytest
 from datetime import datetime
 from bs4 import BeautifulSoup
 import httpx
 from pytest_httpx import HTTPXMock
 
+from enea_outages import client as client_module
 from enea_outages.client import EneaOutagesClient
-from enea_outages.models import OutageType
+from enea_outages.models import Outage, OutageBatch, OutageType
 
 # --- Test Data ---
 
@@ -66,6 +71,110 @@ def test_parse_unplanned_date_format(sync_client: EneaOutagesClient):
     assert end_time == datetime(2025, 11, 29, 14, 30)
 
 
+def test_parse_date_format_capitalized_month(sync_client: EneaOutagesClient):
+    start_time, end_time = sync_client._parse_date_formats("8 Grudnia 2025 r. w godz. 08:00 - 16:00")
+    assert start_time == datetime(2025, 12, 8, 8, 0)
+    assert end_time == datetime(2025, 12, 8, 16, 0)
+
+
+def test_fast_date_parser_handles_exact_layouts():
+    assert client_module._parse_date_formats_fast("8 grudnia 2025 r. w godz. 08:00 - 16:00") == (
+        datetime(2025, 12, 8, 8, 0),
+        datetime(2025, 12, 8, 16, 0),
+    )
+    assert client_module._parse_date_formats_fast("29 listopada 2025 r.  do godziny 14:30") == (
+        None,
+        datetime(2025, 11, 29, 14, 30),
+    )
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "Termin: 8 grudnia 2025 r. w godz. 08:00 - 16:00",
+        "29 listopada 2025 r. do godziny 14:30 (szacowany)",
+        "8 Grudnia 2025 r. w godz. 08:00 - 16:00",
+    ],
+)
+def test_fast_date_parser_defers_other_layouts_to_regex(sync_client: EneaOutagesClient, date_str: str):
+    assert client_module._parse_date_formats_fast(date_str) is None
+    assert sync_client._parse_date_formats(date_str)[1] is not None
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "19 listopada 2025 r. do godziny 12:5",
+        "19 listopada 2025 r. do godziny +1:30",
+        "8 grudnia 2025 r. w godz. 08:00 - 16:0",
+    ],
+)
+def test_fast_date_parser_rejects_what_the_regex_rejects(sync_client: EneaOutagesClient, date_str: str):
+    assert client_module._parse_date_formats_fast(date_str) is None
+    with pytest.raises(ValueError, match="Could not parse date information"):
+        sync_client._parse_date_formats(date_str)
+
+
+def test_fast_date_parser_rejects_non_digit_day():
+    # int() would read "1_9" as 19; the fast path must leave such text to the regex instead.
+    assert client_module._parse_date_formats_fast("1_9 listopada 2025 r. do godziny 12:30") is None
+
+
+@pytest.mark.parametrize("outage_type", [OutageType.PLANNED, OutageType.UNPLANNED, None])
+@pytest.mark.parametrize(
+    ("date_str", "expected"),
+    [
+        (
+            "Termin: 8 grudnia 2025 r. w godz. 08:00 - 16:00",
+            (datetime(2025, 12, 8, 8, 0), datetime(2025, 12, 8, 16, 0)),
+        ),
+        ("29 listopada 2025 r. do godziny 14:30 (szacowany)", (None, datetime(2025, 11, 29, 14, 30))),
+    ],
+)
+def test_parse_date_formats_with_outage_type_hint(
+    sync_client: EneaOutagesClient, outage_type: OutageType | None, date_str: str, expected: tuple
+):
+    # Text in only one format parses the same whatever the hint: a mismatched hint falls back to the other regex.
+    assert sync_client._parse_date_formats(date_str, outage_type) == expected
+
+
+@pytest.mark.parametrize(
+    ("outage_type", "expected"),
+    [
+        (OutageType.PLANNED, (datetime(2025, 12, 8, 8, 0), datetime(2025, 12, 8, 16, 0))),
+        (OutageType.UNPLANNED, (None, datetime(2025, 12, 9, 12, 0))),
+        (None, (datetime(2025, 12, 8, 8, 0), datetime(2025, 12, 8, 16, 0))),
+    ],
+)
+def test_outage_type_hint_decides_text_matching_both_formats(
+    sync_client: EneaOutagesClient, outage_type: OutageType | None, expected: tuple
+):
+    date_str = "8 grudnia 2025 r. w godz. 08:00 - 16:00, przedłużone: 9 grudnia 2025 r. do godziny 12:00"
+    assert sync_client._parse_date_formats(date_str, outage_type) == expected
+
+
+def test_parse_date_formats_rejects_text_without_markers_before_regex(
+    sync_client: EneaOutagesClient, monkeypatch: pytest.MonkeyPatch
+):
+    class ExplodingPattern:
+        def search(self, text):
+            raise AssertionError("regex should not run")
+
+    monkeypatch.setattr(client_module, "_PLANNED_DATE_RE", ExplodingPattern())
+    monkeypatch.setattr(client_module, "_UNPLANNED_DATE_RE", ExplodingPattern())
+    monkeypatch.setattr(client_module, "_DATE_RE", ExplodingPattern())
+    with pytest.raises(ValueError, match="Could not parse date information"):
+        sync_client._parse_date_formats("8 grudnia 2025 r., termin do uzgodnienia")
+
+
+def test_parse_date_formats_is_memoized(sync_client: EneaOutagesClient):
+    date_str = "3 marca 2026 r. do godziny 09:15"
+    first = sync_client._parse_date_formats(date_str)
+    hits_before = client_module._parse_date_formats.cache_info().hits
+    assert sync_client._parse_date_formats(date_str) is first
+    assert client_module._parse_date_formats.cache_info().hits == hits_before + 1
+
+
 def test_parse_invalid_date_format(sync_client: EneaOutagesClient):
     date_str = "Invalid date string"
     with pytest.raises(ValueError, match="Could not parse date information"):
@@ -88,6 +197,64 @@ def test_parse_outage_block_unplanned(sync_client: EneaOutagesClient):
     assert outage.end_time == datetime(2025, 11, 29, 14, 30)
 
 
+def test_parse_outage_block_without_date_raises(sync_client: EneaOutagesClient):
+    soup = BeautifulSoup('<div class="unpl block info"><h4 class="title_">No Date</h4></div>', "html.parser")
+    with pytest.raises(ValueError, match="Missing date information"):
+        sync_client._parse_outage_block(soup.find("div"))
+
+
+def test_parse_outage_block_selectolax(sync_client: EneaOutagesClient):
+    lexbor = pytest.importorskip("selectolax.lexbor")
+    block = lexbor.LexborHTMLParser(SAMPLE_PLANNED_BLOCK).css_first("div.unpl.block.info")
+    outage = sync_client._parse_outage_block(block)
+    assert outage.region == "Test Planned Area"
+    assert outage.description == "Planned outage description."
+    assert outage.start_time == datetime(2025, 12, 8, 8, 0)
+    assert outage.end_time == datetime(2025, 12, 8, 16, 0)
+
+
+def test_parse_outages_and_regions_from_html(sync_client: EneaOutagesClient):
+    html = f"<html><body>{SAMPLE_PLANNED_BLOCK}{SAMPLE_UNPLANNED_BLOCK}</body></html>"
+    outages = sync_client._parse_outages(html)
+    assert [o.region for o in outages] == ["Test Planned Area", "Test Unplanned Area"]
+    assert EneaOutagesClient._parse_regions(SAMPLE_HTML_PAGE_WITH_REGIONS) == ["Zielona Góra", "Poznań"]
+
+
+def test_outage_is_immutable_and_hashable():
+    outage = Outage(region="A", description="B", start_time=None, end_time=datetime(2025, 11, 29, 14, 30))
+    duplicate = Outage(region="A", description="B", start_time=None, end_time=datetime(2025, 11, 29, 14, 30))
+    assert len({outage, duplicate}) == 1
+    assert outage.description_lower == "b"
+    assert "description_lower" not in repr(outage)
+    assert not hasattr(outage, "__dict__")
+    # The derived attribute is not part of the public dataclass shape, but survives pickling and copying.
+    assert dataclasses.asdict(outage) == {
+        "region": "A",
+        "description": "B",
+        "start_time": None,
+        "end_time": datetime(2025, 11, 29, 14, 30),
+    }
+    restored = pickle.loads(pickle.dumps(outage))
+    assert restored == outage and restored.description_lower == "b"
+    assert copy.copy(outage).description_lower == "b"
+    with pytest.raises(AttributeError):
+        outage.region = "C"  # type: ignore[misc]
+
+
+def test_outage_batch_filter_by_address():
+    outages = [
+        Outage(region="A", description="ul. Firlika 1-5", start_time=None, end_time=datetime(2025, 11, 29, 14, 30)),
+        Outage(region="B", description="ul. Polna", start_time=None, end_time=None),
+    ]
+    batch = OutageBatch.from_outages(outages)
+    assert len(batch) == 2
+    assert list(batch) == outages
+    assert batch.filter_by_address("FIRLIKA") == [outages[0]]
+    assert batch.filter_by_address("FIRLIKA")[0] is outages[0]
+    assert batch[1] is outages[1]
+    assert batch.filter_by_address("Nieistniejąca") == []
+
+
 # --- Client Method Tests ---
 
 
@@ -97,6 +264,54 @@ def test_get_available_regions_sync(sync_client: EneaOutagesClient, httpx_mock:
     assert regions == ["Zielona Góra", "Poznań"]
 
 
+def test_get_available_regions_is_memoized(sync_client: EneaOutagesClient, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text=SAMPLE_HTML_PAGE_WITH_REGIONS)
+    httpx_mock.add_response(text=SAMPLE_HTML_PAGE_WITH_REGIONS.replace("Zielona Góra", "Gorzów Wielkopolski"))
+
+    assert sync_client.get_available_regions() == ["Zielona Góra", "Poznań"]
+    assert sync_client.get_available_regions() == ["Zielona Góra", "Poznań"]
+    assert len(httpx_mock.get_requests()) == 1
+
+    assert sync_client.refresh_regions() == ["Gorzów Wielkopolski", "Poznań"]
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_get_available_regions_memo_expires(httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch):
+    now = [1000.0]
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: now[0])
+    httpx_mock.add_response(text=SAMPLE_HTML_PAGE_WITH_REGIONS)
+    httpx_mock.add_response(text=SAMPLE_HTML_PAGE_WITH_REGIONS.replace("Zielona Góra", "Gorzów Wielkopolski"))
+    client = EneaOutagesClient(regions_cache_ttl=3600)
+
+    assert client.get_available_regions() == ["Zielona Góra", "Poznań"]
+    now[0] += 3599
+    assert client.get_available_regions() == ["Zielona Góra", "Poznań"]
+    now[0] += 2
+    assert client.get_available_regions() == ["Gorzów Wielkopolski", "Poznań"]
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_outages_and_regions_share_one_page_fetch(httpx_mock: HTTPXMock):
+    page = SAMPLE_HTML_PAGE_WITH_REGIONS.replace("</body>", f"{SAMPLE_PLANNED_BLOCK}</body>")
+    httpx_mock.add_response(text=page)
+    client = EneaOutagesClient(cache_ttl=300)
+
+    assert client.get_available_regions() == ["Zielona Góra", "Poznań"]
+    outages = client.get_outages_for_region("Poznań", OutageType.PLANNED)
+
+    assert [o.region for o in outages] == ["Test Planned Area"]
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_get_outages_for_region_seeds_regions(sync_client: EneaOutagesClient, httpx_mock: HTTPXMock):
+    page = SAMPLE_HTML_PAGE_WITH_REGIONS.replace("</body>", f"{SAMPLE_UNPLANNED_BLOCK}</body>")
+    httpx_mock.add_response(text=page)
+
+    assert len(sync_client.get_outages_for_region("Szczecin", OutageType.UNPLANNED)) == 1
+    assert sync_client.get_available_regions() == ["Zielona Góra", "Poznań"]
+    assert len(httpx_mock.get_requests()) == 1
+
+
 def test_get_outages_for_region_unplanned_sync(sync_client: EneaOutagesClient, httpx_mock: HTTPXMock):
     httpx_mock.add_response(
         url=f"{EneaOutagesClient.BASE_URL}?page={OutageType.UNPLANNED.value}&oddzial=Pozna%C5%84",
@@ -160,6 +375,195 @@ def test_get_outages_for_address_planned_sync(sync_client: EneaOutagesClient, ht
     assert len(outages_no_match) == 0
 
 
+def test_get_outages_for_regions_sync(sync_client: EneaOutagesClient, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        url=f"{EneaOutagesClient.BASE_URL}?page={OutageType.PLANNED.value}&oddzial=Pozna%C5%84",
+        text=f"<html><body>{SAMPLE_PLANNED_BLOCK}</body></html>",
+    )
+    httpx_mock.add_response(
+        url=f"{EneaOutagesClient.BASE_URL}?page={OutageType.PLANNED.value}&oddzial=Szczecin",
+        text="<html><body></body></html>",
+    )
+    results = sync_client.get_outages_for_regions(["Poznań", "Szczecin"], OutageType.PLANNED)
+    assert list(results) == ["Poznań", "Szczecin"]
+    assert [o.region for o in results["Poznań"]] == ["Test Planned Area"]
+    assert results["Szczecin"] == []
+
+
+def test_get_outages_for_regions_rejects_single_str(sync_client: EneaOutagesClient, httpx_mock: HTTPXMock):
+    with pytest.raises(TypeError, match="not a single str"):
+        sync_client.get_outages_for_regions("Poznań")
+    assert httpx_mock.get_requests() == []
+
+
+def test_get_outages_for_all_regions_sync(sync_client: EneaOutagesClient, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(
+        url=f"{EneaOutagesClient.BASE_URL}?page={OutageType.PLANNED.value}&oddzial=Pozna%C5%84",
+        text=SAMPLE_HTML_PAGE_WITH_REGIONS,
+    )
+    httpx_mock.add_response(
+        url=f"{EneaOutagesClient.BASE_URL}?page={OutageType.UNPLANNED.value}&oddzial=Zielona+G%C3%B3ra",
+        text="<html><body></body></html>",
+    )
+    httpx_mock.add_response(
+        url=f"{EneaOutagesClient.BASE_URL}?page={OutageType.UNPLANNED.value}&oddzial=Pozna%C5%84",
+        text=f"<html><body>{SAMPLE_UNPLANNED_BLOCK}</body></html>",
+    )
+    results = sync_client.get_outages_for_all_regions(OutageType.UNPLANNED)
+    assert list(results) == ["Zielona Góra", "Poznań"]
+    assert results["Zielona Góra"] == []
+    assert [o.region for o in results["Poznań"]] == ["Test Unplanned Area"]
+
+
+def test_get_outages_for_all_regions_passes_retries_through(
+    sync_client: EneaOutagesClient, httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(client_module.time, "sleep", lambda _: None)
+    httpx_mock.add_response(
+        url=f"{EneaOutagesClient.BASE_URL}?page={OutageType.PLANNED.value}&oddzial=Pozna%C5%84",
+        text=SAMPLE_HTML_PAGE_WITH_REGIONS,
+    )
+    for region in ("Zielona+G%C3%B3ra", "Pozna%C5%84"):
+        httpx_mock.add_response(
+            url=f"{EneaOutagesClient.BASE_URL}?page={OutageType.UNPLANNED.value}&oddzial={region}", status_code=503
+        )
+
+    assert sync_client.get_outages_for_all_regions(OutageType.UNPLANNED, retries=0) == {}
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_get_outages_for_regions_retries_http_errors(
+    sync_client: EneaOutagesClient, httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch
+):
+    delays: list[float] = []
+    monkeypatch.setattr(client_module.time, "sleep", delays.append)
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_response(text=f"<html><body>{SAMPLE_UNPLANNED_BLOCK}</body></html>")
+
+    results = sync_client.get_outages_for_regions(["Poznań"], OutageType.UNPLANNED, retries=1)
+    assert len(results["Poznań"]) == 1
+    assert delays == [EneaOutagesClient.RETRY_BACKOFF]
+
+
+def test_get_outages_for_regions_gives_up_after_retries(
+    sync_client: EneaOutagesClient, httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(client_module.time, "sleep", lambda _: None)
+    for _ in range(3):
+        httpx_mock.add_response(status_code=500)
+    assert sync_client.get_outages_for_regions(["Poznań"], retries=2) == {}
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_get_outages_for_regions_does_not_retry_client_errors(
+    sync_client: EneaOutagesClient, httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch
+):
+    delays: list[float] = []
+    monkeypatch.setattr(client_module.time, "sleep", delays.append)
+    httpx_mock.add_response(
+        url=f"{EneaOutagesClient.BASE_URL}?page={OutageType.UNPLANNED.value}&oddzial=Atlantyda",
+        status_code=404,
+    )
+    httpx_mock.add_response(
+        url=f"{EneaOutagesClient.BASE_URL}?page={OutageType.UNPLANNED.value}&oddzial=Pozna%C5%84",
+        text=f"<html><body>{SAMPLE_UNPLANNED_BLOCK}</body></html>",
+    )
+
+    results = sync_client.get_outages_for_regions(["Atlantyda", "Poznań"], retries=2)
+    assert list(results) == ["Poznań"]
+    assert len(results["Poznań"]) == 1
+    assert delays == []
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_get_outages_for_region_cache_reuses_parsed_page(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text=f"<html><body>{SAMPLE_UNPLANNED_BLOCK}</body></html>")
+    client = EneaOutagesClient(cache_ttl=300)
+
+    first = client.get_outages_for_region("Poznań", OutageType.UNPLANNED)
+    matching = client.get_outages_for_address("Unplanned outage", "Poznań", OutageType.UNPLANNED)
+
+    assert first == matching
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_get_outages_for_region_cache_expires_and_clears(httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch):
+    now = [1000.0]
+    monkeypatch.setattr(client_module.time, "monotonic", lambda: now[0])
+    for _ in range(3):
+        httpx_mock.add_response(text=f"<html><body>{SAMPLE_UNPLANNED_BLOCK}</body></html>")
+    client = EneaOutagesClient(cache_ttl=60)
+
+    client.get_outages_for_region("Poznań")
+    client.get_outages_for_region("Poznań")
+    assert len(httpx_mock.get_requests()) == 1
+
+    now[0] += 61
+    client.get_outages_for_region("Poznań")
+    assert len(httpx_mock.get_requests()) == 2
+
+    client.clear_cache()
+    client.get_outages_for_region("Poznań")
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_get_outages_for_region_cache_evicts_least_recently_used(httpx_mock: HTTPXMock):
+    for _ in range(3):
+        httpx_mock.add_response(text=f"<html><body>{SAMPLE_UNPLANNED_BLOCK}</body></html>")
+    client = EneaOutagesClient(cache_ttl=300, cache_size=1)
+
+    client.get_outages_for_region("Poznań")
+    client.get_outages_for_region("Szczecin")
+    client.get_outages_for_region("Poznań")
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_ttl_cache_drops_key_locks_after_use():
+    def failing_fetch() -> int:
+        raise RuntimeError("fetch failed")
+
+    cache: client_module._TTLCache[int] = client_module._TTLCache(ttl=300, maxsize=1)
+    assert cache.get_or_set("a", lambda: 1) == 1
+    with pytest.raises(RuntimeError):
+        cache.get_or_set("b", failing_fetch)
+    assert cache._key_locks == {}
+
+
+@pytest.mark.parametrize("use_automaton", [True, False])
+def test_get_outages_for_addresses(
+    sync_client: EneaOutagesClient, httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch, use_automaton: bool
+):
+    if use_automaton:
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(client_module, "ahocorasick", None)
+    httpx_mock.add_response(text=f"<html><body>{SAMPLE_PLANNED_BLOCK}{SAMPLE_UNPLANNED_BLOCK}</body></html>")
+
+    matches = sync_client.get_outages_for_addresses(
+        ["UNPLANNED outage", "NonExistent", "description", "Unplanned Outage"], "Poznań"
+    )
+
+    assert [(outage.region, hits) for outage, hits in matches] == [
+        ("Test Planned Area", ["description"]),
+        ("Test Unplanned Area", ["UNPLANNED outage", "description", "Unplanned Outage"]),
+    ]
+
+
+def test_get_outages_for_addresses_rejects_single_str(sync_client: EneaOutagesClient, httpx_mock: HTTPXMock):
+    with pytest.raises(TypeError, match="not a single str"):
+        sync_client.get_outages_for_addresses("Polna", "Poznań")
+    assert httpx_mock.get_requests() == []
+
+
+def test_fetch_logs_negotiated_protocol_at_debug(
+    sync_client: EneaOutagesClient, httpx_mock: HTTPXMock, caplog: pytest.LogCaptureFixture
+):
+    httpx_mock.add_response(text="<html></html>", headers={"Content-Encoding": "identity"})
+    with caplog.at_level("DEBUG", logger="enea_outages.client"):
+        sync_client.get_outages_for_region("Poznań")
+    assert "via HTTP/1.1" in caplog.text
+
+
 def test_http_error_sync(sync_client: EneaOutagesClient, httpx_mock: HTTPXMock):
     httpx_mock.add_response(status_code=500)
     with pytest.raises(httpx.HTTPStatusError):
@@ -200,6 +604,20 @@ def test_get_outages_for_region_skips_unparseable_block(
     assert len(outages) == 1
     assert outages[0].region == "Test Unplanned Area"
     assert "Error parsing outage block" in caplog.text
+    assert "Offending block" not in caplog.text
+
+
+def test_get_outages_for_region_logs_offending_block_at_debug(
+    sync_client: EneaOutagesClient, httpx_mock: HTTPXMock, caplog: pytest.LogCaptureFixture
+):
+    httpx_mock.add_response(
+        text='<html><body><div class="unpl block info"><p class="bold subtext">bad</p></div></body></html>',
+    )
+    with caplog.at_level("DEBUG", logger="enea_outages.client"):
+        assert sync_client.get_outages_for_region("Poznań", OutageType.UNPLANNED) == []
+
+    assert "Offending block" in caplog.text
+    assert '<p class="bold subtext">bad</p>' in caplog.text
 
 
 def test_get_outages_for_region_skips_block_raising_attribute_error(
@@ -212,7 +630,7 @@ def test_get_outages_for_region_skips_block_raising_attribute_error(
         text=f"<html><body>{SAMPLE_UNPLANNED_BLOCK}</body></html>",
     )
 
-    def raise_attribute_error(self, block):
+    def raise_attribute_error(self, block, outage_type=None):
         raise AttributeError("simulated malformed block")
 
     monkeypatch.setattr(EneaOutagesClient, "_parse_outage_block", raise_attribute_error)
@@ -224,6 +642,87 @@ def test_get_outages_for_region_skips_block_raising_attribute_error(
     assert "Error parsing outage block" in caplog.text
 
 
+@pytest.mark.parametrize("bs4_parser", ["lxml", "html.parser"])
+def test_get_outages_and_regions_beautifulsoup_fallback(
+    httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch, bs4_parser: str
+):
+    monkeypatch.setattr(client_module, "_SELECTOLAX_AVAILABLE", False)
+    monkeypatch.setattr(client_module, "_BS4_PARSER", bs4_parser)
+    sync_client = EneaOutagesClient(fast_regions=False)
+    httpx_mock.add_response(text=f"<html><body>{SAMPLE_UNPLANNED_BLOCK}</body></html>")
+    httpx_mock.add_response(text=SAMPLE_HTML_PAGE_WITH_REGIONS)
+
+    outages = sync_client.get_outages_for_region("Poznań", OutageType.UNPLANNED)
+    assert len(outages) == 1
+    assert outages[0].region == "Test Unplanned Area"
+    assert outages[0].end_time == datetime(2025, 11, 29, 14, 30)
+
+    assert sync_client.get_available_regions() == ["Zielona Góra", "Poznań"]
+
+
+def test_beautifulsoup_fallback_strains_to_outage_blocks(
+    sync_client: EneaOutagesClient, httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(client_module, "_SELECTOLAX_AVAILABLE", False)
+    page = SAMPLE_HTML_PAGE_WITH_REGIONS.replace(
+        "</body>",
+        f'<div class="content"><div class="unpl other">Not an outage</div>{SAMPLE_UNPLANNED_BLOCK}</div></body>',
+    )
+    httpx_mock.add_response(text=page)
+
+    outages = sync_client.get_outages_for_region("Poznań", OutageType.UNPLANNED)
+
+    assert [o.region for o in outages] == ["Test Unplanned Area"]
+    assert sync_client.get_available_regions() == ["Zielona Góra", "Poznań"]
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_get_outages_for_address_skips_non_matching_blocks_before_parsing(
+    sync_client: EneaOutagesClient, httpx_mock: HTTPXMock, caplog: pytest.LogCaptureFixture
+):
+    unparseable_block = """
+    <div class="unpl block info">
+        <h4 class="title_">Broken Block</h4>
+        <p class="bold subtext">not a date at all</p>
+        <p class="description">Some other street.</p>
+    </div>
+    """
+    httpx_mock.add_response(
+        text=f"<html><body>{unparseable_block}{SAMPLE_UNPLANNED_BLOCK}</body></html>",
+    )
+    with caplog.at_level("WARNING"):
+        outages = sync_client.get_outages_for_address("unplanned OUTAGE", "Poznań", OutageType.UNPLANNED)
+
+    assert [o.region for o in outages] == ["Test Unplanned Area"]
+    assert "Error parsing outage block" not in caplog.text
+
+
+@pytest.mark.parametrize("fast_regions", [True, False])
+def test_get_outages_for_address_seeds_regions(httpx_mock: HTTPXMock, fast_regions: bool):
+    page = SAMPLE_HTML_PAGE_WITH_REGIONS.replace("</body>", f"{SAMPLE_UNPLANNED_BLOCK}</body>")
+    httpx_mock.add_response(text=page)
+    client = EneaOutagesClient(fast_regions=fast_regions)
+
+    assert [o.region for o in client.get_outages_for_address("unplanned outage")] == ["Test Unplanned Area"]
+    assert client.get_available_regions() == ["Zielona Góra", "Poznań"]
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.parametrize("fast_regions", [True, False])
+def test_get_available_regions_regex_and_dom_agree(httpx_mock: HTTPXMock, fast_regions: bool):
+    page = """
+    <select class="form" id="oddzial">
+        <option value="">wybierz oddział</option>
+        <option data-value="x" value="Gorz&oacute;w Wielkopolski">Gorzów</option>
+        <option selected="selected" value="Poznań">Poznań</option>
+    </select>
+    <select id="other"><option value="Nope">Nope</option></select>
+    """
+    httpx_mock.add_response(text=page)
+    client = EneaOutagesClient(fast_regions=fast_regions)
+    assert client.get_available_regions() == ["Gorzów Wielkopolski", "Poznań"]
+
+
 def test_get_available_regions_no_select_tag(sync_client: EneaOutagesClient, httpx_mock: HTTPXMock):
     httpx_mock.add_response(text="<html><body><p>No region selector here.</p></body></html>")
     regions = sync_client.get_available_regions()